@@ -4,17 +4,24 @@
 # dependencies = [
 #     "google-api-python-client",
 #     "google-auth",
+#     "ijson",
+#     "orjson",
 #     "requests",
 # ]
 # ///
-import csv
-import io
-import os
+import functools
 import re
+import threading
 import tomllib
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -59,55 +66,113 @@ class LazyLibrarianConfig:
 
 # --- Load config ---
 
-_script_dir = os.path.dirname(os.path.abspath(__file__))
-_config_path = os.path.join(_script_dir, 'env.toml')
-if not os.path.exists(_config_path):
-    raise FileNotFoundError("env.toml not found. Copy env.example.toml to env.toml and fill in your values.")
-with open(_config_path, 'rb') as f:
-    _config = tomllib.load(f)
-
-google_cfg = GoogleConfig(
-    api_key=_config['google'].get('api_key'),
-    service_account_file=_config['google'].get('service_account_file'),
-    spreadsheet_id=_config['google']['spreadsheet_id'],
-    range=_config['google']['spreadsheet_range'],
-    ebooks_range=_config['google'].get('ebooks_range'),
-    audiobooks_range=_config['google'].get('audiobooks_range'),
-    write_status=_config['google'].get('write_status', True),
-)
-
-radarr_cfg = RadarrConfig(
-    api_key=_config['radarr']['api_key'],
-    url=_config['radarr']['url'],
-    quality_profile=_config['radarr']['quality_profile'],
-    root_folder_path=_config['radarr']['root_folder_path'],
-    spreadsheet_id=_config['radarr'].get('spreadsheet_id', google_cfg.spreadsheet_id),
-    range=_config['radarr'].get('spreadsheet_range', google_cfg.range),
-)
-
-sonarr_cfg = SonarrConfig(
-    api_key=_config['sonarr']['api_key'],
-    url=_config['sonarr']['url'],
-    quality_profile=_config['sonarr']['quality_profile'],
-    root_folder_path=_config['sonarr']['root_folder_path'],
-    spreadsheet_id=_config['sonarr'].get('spreadsheet_id', google_cfg.spreadsheet_id),
-    range=_config['sonarr'].get('spreadsheet_range', google_cfg.range),
-)
-
-_ll = _config.get('lazylibrarian', {})
-ll_cfg = LazyLibrarianConfig(
-    api_key=_ll.get('api_key'),
-    url=_ll.get('url'),
-    spreadsheet_id=_ll.get('spreadsheet_id', google_cfg.spreadsheet_id),
-)
-
-radarr_session = requests.Session()
-radarr_session.headers.update({'X-Api-Key': radarr_cfg.api_key})
-
-sonarr_session = requests.Session()
-sonarr_session.headers.update({'X-Api-Key': sonarr_cfg.api_key})
-
-lazylibrarian_session = requests.Session()
+_CONFIG_PATH = Path(__file__).resolve().parent / 'env.toml'
+
+
+def load_config(config_path=_CONFIG_PATH):
+    """Read env.toml and return (google_cfg, radarr_cfg, sonarr_cfg, ll_cfg)."""
+    if not config_path.exists():
+        raise FileNotFoundError("env.toml not found. Copy env.example.toml to env.toml and fill in your values.")
+    with config_path.open('rb') as f:
+        config = tomllib.load(f)
+
+    google = GoogleConfig(
+        api_key=config['google'].get('api_key'),
+        service_account_file=config['google'].get('service_account_file'),
+        spreadsheet_id=config['google']['spreadsheet_id'],
+        range=config['google']['spreadsheet_range'],
+        ebooks_range=config['google'].get('ebooks_range'),
+        audiobooks_range=config['google'].get('audiobooks_range'),
+        write_status=config['google'].get('write_status', True),
+    )
+
+    radarr = RadarrConfig(
+        api_key=config['radarr']['api_key'],
+        url=config['radarr']['url'],
+        quality_profile=config['radarr']['quality_profile'],
+        root_folder_path=config['radarr']['root_folder_path'],
+        spreadsheet_id=config['radarr'].get('spreadsheet_id', google.spreadsheet_id),
+        range=config['radarr'].get('spreadsheet_range', google.range),
+    )
+
+    sonarr = SonarrConfig(
+        api_key=config['sonarr']['api_key'],
+        url=config['sonarr']['url'],
+        quality_profile=config['sonarr']['quality_profile'],
+        root_folder_path=config['sonarr']['root_folder_path'],
+        spreadsheet_id=config['sonarr'].get('spreadsheet_id', google.spreadsheet_id),
+        range=config['sonarr'].get('spreadsheet_range', google.range),
+    )
+
+    ll = config.get('lazylibrarian', {})
+    lazylibrarian = LazyLibrarianConfig(
+        api_key=ll.get('api_key'),
+        url=ll.get('url'),
+        spreadsheet_id=ll.get('spreadsheet_id', google.spreadsheet_id),
+    )
+
+    return google, radarr, sonarr, lazylibrarian
+
+
+# Upper bound on concurrent Radarr/Sonarr requests; matches the per-host connection pool size
+MAX_WORKERS = 16
+
+# Retry transient failures (rate limits, 5xx blips) with backoff instead of aborting the run
+HTTP_RETRIES = 5
+
+
+class _ArrRetry(Retry):
+    # POSTs aren't idempotent: a 5xx or dropped response may still have added the item, so only
+    # retry them on statuses that mean the request was refused outright
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method == 'POST':
+            return status_code in (429, 503)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# Radarr/Sonarr GETs are read-only, so they are also retried on rate limits and 5xx.
+# raise_on_status=False hands the last response back once retries run out, so the
+# status_code checks below still turn a persistent failure into "Failed to Add" for that row.
+_ARR_RETRY = _ArrRetry(total=HTTP_RETRIES, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                       allowed_methods=['GET'], raise_on_status=False)
+
+# LazyLibrarian adds, queues and searches through GET commands, so only retry
+# connections that never reached it
+_LL_RETRY = Retry(total=HTTP_RETRIES, connect=HTTP_RETRIES, read=False, status=0, other=0, backoff_factor=0.3)
+
+
+def _make_session(retry):
+    # One pooled keep-alive connection set per host instead of a new TCP/TLS handshake per call
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _json(response):
+    # orjson is a faster drop-in for response.json()
+    return orjson.loads(response.content)
+
+
+def _date_only(value):
+    # Applied when API data is ingested so per-row code reads ready-made dates,
+    # e.g. "2024-03-15T00:00:00Z" -> "2024-03-15", None -> ""
+    return (value or "")[:10]
+
+
+# API key headers are attached by configure()
+radarr_session = _make_session(_ARR_RETRY)
+sonarr_session = _make_session(_ARR_RETRY)
+lazylibrarian_session = _make_session(_LL_RETRY)
+
+
+def configure(config_path=_CONFIG_PATH):
+    """Load env.toml into the module-level configs and attach the *arr API keys to their sessions."""
+    global google_cfg, radarr_cfg, sonarr_cfg, ll_cfg
+    google_cfg, radarr_cfg, sonarr_cfg, ll_cfg = load_config(config_path)
+    radarr_session.headers.update({'X-Api-Key': radarr_cfg.api_key})
+    sonarr_session.headers.update({'X-Api-Key': sonarr_cfg.api_key})
 
 
 # --- Google Sheets ---
@@ -125,47 +190,72 @@ def build_sheets_service():
         raise ValueError("No Google auth configured: set api_key or service_account_file in env.toml")
 
 
+_RANGE_RE = re.compile(r'([^!]+)![A-Za-z]+(\d*)')
+
+
+@functools.cache
+def _parse_range(range_name):
+    # Split an A1 range into sheet name and start row, e.g. "Sheet1!A2:A" -> ("Sheet1", "2")
+    match = _RANGE_RE.match(range_name)
+    if not match:
+        raise ValueError(f"Unsupported spreadsheet range: {range_name!r}")
+    return match.group(1), match.group(2)
+
+
 def get_read_range(range_name):
     # Read URL (A), current status (B), and current date (C) in one call
     # e.g. "Sheet1!A2:A" -> "Sheet1!A2:C"
-    sheet_name, cell_part = range_name.split('!')
-    start_row = ''.join(c for c in cell_part.split(':')[0] if c.isdigit())
+    sheet_name, start_row = _parse_range(range_name)
     return f"{sheet_name}!A{start_row}:C"
 
 
-def get_output_range(range_name):
-    # Derive the 2-column output range (B=status, C=release date)
-    # e.g. "Sheet1!A2:A" -> "Sheet1!B2:C"
-    sheet_name, cell_part = range_name.split('!')
-    start_row = ''.join(c for c in cell_part.split(':')[0] if c.isdigit())
-    return f"{sheet_name}!B{start_row}:C"
+def get_output_range(range_name, first, last):
+    # Derive the 2-column output range (B=status, C=release date) for data rows first..last
+    # e.g. ("Sheet1!A2:A", 0, 3) -> "Sheet1!B2:C5"
+    sheet_name, start_row = _parse_range(range_name)
+    start = int(start_row or 1)
+    return f"{sheet_name}!B{start + first}:C{start + last}"
+
+
+def _changed_runs(rows, current_rows):
+    # Yield (first, last) index pairs for contiguous runs of rows whose values differ from the sheet
+    first = None
+    for i, row in enumerate(rows):
+        current = current_rows[i][1:3] if i < len(current_rows) else []
+        current = current + [""] * (2 - len(current))
+        if row != current:
+            if first is None:
+                first = i
+        elif first is not None:
+            yield first, i - 1
+            first = None
+    if first is not None:
+        yield first, len(rows) - 1
 
 
 def get_google_sheets_data(service, range_name, spreadsheet_id=None):
     try:
-        result = service.spreadsheets().values().get(
+        result = service.spreadsheets().values().batchGet(
             spreadsheetId=spreadsheet_id or google_cfg.spreadsheet_id,
-            range=get_read_range(range_name)).execute()
-        return result.get('values', [])
+            ranges=[get_read_range(range_name)]).execute(num_retries=HTTP_RETRIES)
+        return result['valueRanges'][0].get('values', [])
     except HttpError as error:
         print(f"Failed to read sheet: {error}")
         raise
 
 
-def format_date(date_str):
-    # Trim ISO timestamp to just the date portion, e.g. "2024-03-15T00:00:00Z" -> "2024-03-15"
-    return date_str[:10] if date_str else ""
-
-
-def update_sheet_statuses(service, rows, range_name, spreadsheet_id=None):
-    # rows is a list of [status, release_date] pairs
+def update_sheet_statuses(service, rows, current_rows, range_name, spreadsheet_id=None):
+    # rows is a list of [status, release_date] pairs; current_rows is the A:C data read earlier.
+    # Only runs of rows that actually changed are written, all in one batchUpdate.
+    data = [{'range': get_output_range(range_name, first, last), 'values': rows[first:last + 1]}
+            for first, last in _changed_runs(rows, current_rows)]
+    if not data:
+        return
     try:
-        service.spreadsheets().values().update(
+        service.spreadsheets().values().batchUpdate(
             spreadsheetId=spreadsheet_id or google_cfg.spreadsheet_id,
-            range=get_output_range(range_name),
-            valueInputOption='RAW',
-            body={'values': rows}
-        ).execute()
+            body={'valueInputOption': 'RAW', 'data': data}
+        ).execute(num_retries=HTTP_RETRIES)
     except HttpError as error:
         if google_cfg.api_key and not google_cfg.service_account_file:
             raise RuntimeError("Writing to sheets requires a service account, not an API key.") from error
@@ -174,46 +264,83 @@ def update_sheet_statuses(service, rows, range_name, spreadsheet_id=None):
 
 # --- TMDb / Radarr / Sonarr ---
 
+_TMDB_RE = re.compile(r'themoviedb\.org/(movie|tv)/(\d+)')
+
+
+# Returns (kind, tmdb_id) where kind is 'movie' or 'tv', or (None, None) for other URLs.
 def get_tmdb_id(url):
-    if 'themoviedb.org/movie/' in url:
-        return url.split('/movie/')[1].split('-')[0]
-    elif 'themoviedb.org/tv/' in url:
-        return url.split('/tv/')[1].split('-')[0]
-    return None
+    match = _TMDB_RE.search(url)
+    return (match.group(1), match.group(2)) if match else (None, None)
+
+
+def _stream_items(session, url):
+    # Decode a JSON array item by item so large libraries are never held in memory whole
+    with session.get(url, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, 'item', use_float=True)
+
+
+def fetch_radarr_movies():
+    """Fetch the whole Radarr library once, keyed by tmdbId -> (hasFile, digitalRelease date)."""
+    return {m['tmdbId']: (m.get('hasFile'), _date_only(m.get('digitalRelease')))
+            for m in _stream_items(radarr_session, f"{radarr_cfg.url}/movie") if m.get('tmdbId')}
+
+
+def fetch_sonarr_series():
+    """Fetch the whole Sonarr library once, keyed by tvdbId -> percentOfEpisodes."""
+    return {s['tvdbId']: s.get('statistics', {}).get('percentOfEpisodes', 0)
+            for s in _stream_items(sonarr_session, f"{sonarr_cfg.url}/series") if s.get('tvdbId')}
 
 
 # Returns (in_radarr, status_str, digital_release_date). status_str is None if not in Radarr.
-def get_radarr_status(tmdb_id):
-    response = radarr_session.get(f"{radarr_cfg.url}/movie?tmdbId={tmdb_id}")
-    movies = response.json()
-    if not movies:
+def get_radarr_status(tmdb_id, radarr_movies):
+    movie = radarr_movies.get(int(tmdb_id))
+    if movie is None:
         # Not in Radarr yet - look up release date from Radarr's TMDb cache
-        lookup = radarr_session.get(f"{radarr_cfg.url}/movie/lookup/tmdb?tmdbId={tmdb_id}")
-        release_date = format_date(lookup.json().get('digitalRelease')) if lookup.status_code == 200 else ""
+        lookup = radarr_session.get(f"{radarr_cfg.url}/movie/lookup/tmdb", params={'tmdbId': tmdb_id})
+        release_date = _date_only(_json(lookup).get('digitalRelease')) if lookup.status_code == 200 else ""
         return False, None, release_date
-    movie = movies[0]
-    status = "Downloaded" if movie.get('hasFile') else "Monitored"
-    return True, status, format_date(movie.get('digitalRelease'))
+    has_file, digital_release = movie
+    status = "Downloaded" if has_file else "Monitored"
+    return True, status, digital_release
+
+
+@functools.lru_cache(maxsize=1024)
+def _sonarr_lookup(tmdb_id):
+    """Sonarr's series lookup for a TMDb ID, memoized so duplicate rows for a show share one call.
 
+    Raises requests.HTTPError on failure; lru_cache doesn't cache exceptions, so a later row retries.
+    """
+    response = sonarr_session.get(f"{sonarr_cfg.url}/series/lookup", params={'term': f"tmdb:{tmdb_id}"})
+    response.raise_for_status()
+    shows = _json(response)
+    for show in shows:
+        show['firstAired'] = _date_only(show.get('firstAired'))
+    return shows
 
-# Returns (in_sonarr, status_str, first_aired_date). status_str is None if not in Sonarr.
-def get_sonarr_status(tmdb_id):
-    lookup = sonarr_session.get(f"{sonarr_cfg.url}/series/lookup?term=tmdb:{tmdb_id}").json()
+
+# Returns (in_sonarr, status_str, first_aired_date, show_data). status_str is None if not in Sonarr;
+# show_data is the lookup result to pass to add_to_sonarr.
+def get_sonarr_status(tmdb_id, sonarr_series):
+    try:
+        lookup = _sonarr_lookup(tmdb_id)
+    except requests.HTTPError as error:
+        print(f"Sonarr lookup failed for tmdbId {tmdb_id}: {error}")
+        return True, "Lookup Failed", "", None
     if not lookup:
         print(f"Could not find series with tmdbId {tmdb_id}")
-        return True, "Not Found", ""
-    first_aired = format_date(lookup[0].get('firstAired'))
-    tvdb_id = lookup[0]['tvdbId']
-    series = sonarr_session.get(f"{sonarr_cfg.url}/series?tvdbId={tvdb_id}").json()
-    if not series:
-        return False, None, first_aired
-    stats = series[0].get('statistics', {})
-    pct = stats.get('percentOfEpisodes', 0)
+        return True, "Not Found", "", None
+    show_data = lookup[0]
+    first_aired = show_data['firstAired']
+    pct = sonarr_series.get(show_data['tvdbId'])
+    if pct is None:
+        return False, None, first_aired, show_data
     if pct == 100:
-        return True, "Downloaded", first_aired
+        return True, "Downloaded", first_aired, show_data
     elif pct > 0:
-        return True, f"Partial ({pct:.0f}%)", first_aired
-    return True, "Monitored", first_aired
+        return True, f"Partial ({pct:.0f}%)", first_aired, show_data
+    return True, "Monitored", first_aired, show_data
 
 
 def add_to_radarr(tmdb_id):
@@ -230,24 +357,21 @@ def add_to_radarr(tmdb_id):
     return add_response.status_code == 201
 
 
-def add_to_sonarr(tmdb_id):
-    response = sonarr_session.get(f"{sonarr_cfg.url}/series/lookup?term=tmdb:{tmdb_id}")
-    if response.status_code == 200 and response.json():
-        show_data = response.json()[0]
-        payload = {
-            "title": show_data['title'],
-            "qualityProfileId": sonarr_cfg.quality_profile,
-            "tvdbId": int(show_data['tvdbId']),
-            "rootFolderPath": sonarr_cfg.root_folder_path,
-            "monitored": True,
-            "addOptions": {
-                "searchForMissingEpisodes": True
-            }
+def add_to_sonarr(show_data):
+    payload = {
+        "title": show_data['title'],
+        "qualityProfileId": sonarr_cfg.quality_profile,
+        "tvdbId": int(show_data['tvdbId']),
+        "rootFolderPath": sonarr_cfg.root_folder_path,
+        "monitored": True,
+        "addOptions": {
+            "searchForMissingEpisodes": True
         }
-        add_response = sonarr_session.post(f"{sonarr_cfg.url}/series", json=payload)
-        print(add_response.json())
-        return add_response.status_code == 201
-    return False
+    }
+    add_response = sonarr_session.post(f"{sonarr_cfg.url}/series", json=payload)
+    # Print the raw body: a failed add may come back as a proxy's HTML error page or an empty body
+    print(add_response.text)
+    return add_response.status_code == 201
 
 
 # --- GoodReads / LazyLibrarian ---
@@ -267,9 +391,14 @@ def fetch_lazylibrarian_books():
     )
     if response.status_code != 200:
         return {}
-    data = response.json()
+    data = _json(response)
     books = data if isinstance(data, list) else data.get('books', [])
-    return {str(b['BookID']): b for b in books if b.get('BookID')}
+    ll_books = {}
+    for b in books:
+        if b.get('BookID'):
+            b['BookDate'] = _date_only(b.get('BookDate'))
+            ll_books[str(b['BookID'])] = b
+    return ll_books
 
 
 # Returns (in_ll, status_str, pub_date). status_str is None if not in LazyLibrarian.
@@ -277,7 +406,7 @@ def get_book_status(goodreads_id, book_type, ll_books):
     book = ll_books.get(str(goodreads_id))
     if not book:
         return False, None, ""
-    pub_date = format_date(book.get('BookDate', ''))
+    pub_date = book['BookDate']
     library_field = 'AudioLibrary' if book_type == 'audiobook' else 'BookLibrary'
     status_field = 'AudioStatus' if book_type == 'audiobook' else 'Status'
     if book.get(library_field):
@@ -300,7 +429,7 @@ def resume_authors(goodreads_id):
         params={'apikey': ll_cfg.api_key, 'cmd': 'getBookAuthors', 'id': goodreads_id}
     )
     if resp.status_code == 200:
-        for author in resp.json():
+        for author in _json(resp):
             author_id = author.get('AuthorID')
             if author_id:
                 _ll_api({'cmd': 'resumeAuthor', 'id': author_id})
@@ -324,121 +453,161 @@ def add_to_lazylibrarian(goodreads_id, book_type):
     return True
 
 
+def process_book_row(row_data, book_type, ll_books):
+    """Check/add a single book row and return its [status, pub_date] pair."""
+    url = row_data[0] if row_data else ""
+    current_status = row_data[1] if len(row_data) > 1 else ""
+    current_date = row_data[2] if len(row_data) > 2 else ""
+
+    if not url:
+        return ["", ""]
+
+    if current_status == "Downloaded":
+        return [current_status, current_date]
+
+    goodreads_id = get_goodreads_id(url)
+    if not goodreads_id:
+        return ["", ""]
+
+    in_ll, status, pub_date = get_book_status(goodreads_id, book_type, ll_books)
+    if status == "Downloaded":
+        print(f"{book_type.capitalize()} with GoodReads ID {goodreads_id} is Downloaded")
+    elif not in_ll:
+        if add_to_lazylibrarian(goodreads_id, book_type):
+            print(f"Added {book_type} with GoodReads ID {goodreads_id} to LazyLibrarian")
+            status = "Monitored"
+        else:
+            print(f"Failed to add {book_type} with GoodReads ID {goodreads_id} to LazyLibrarian")
+            status = "Failed to Add"
+    elif status == "Skipped":
+        # Book exists but Skipped — resume the author then re-queue and search
+        author_id = ll_books.get(str(goodreads_id), {}).get('AuthorID')
+        if author_id:
+            _ll_api({'cmd': 'resumeAuthor', 'id': author_id})
+        want_and_search_lazylibrarian(goodreads_id, book_type)
+        print(f"Re-queued {book_type} with GoodReads ID {goodreads_id} (was Skipped)")
+        status = "Monitored"
+    else:
+        print(f"{book_type.capitalize()} with GoodReads ID {goodreads_id} is in LazyLibrarian ({status})")
+
+    return [status, pub_date]
+
+
 def process_books_tab(sheets_service, range_name, book_type, ll_books, spreadsheet_id=None):
     links = get_google_sheets_data(sheets_service, range_name, spreadsheet_id)
-    rows = []
-
-    for row_data in links:
-        url = row_data[0] if row_data else ""
-        current_status = row_data[1] if len(row_data) > 1 else ""
-        current_date = row_data[2] if len(row_data) > 2 else ""
-
-        if not url:
-            rows.append(["", ""])
-            continue
-
-        if current_status == "Downloaded":
-            rows.append([current_status, current_date])
-            continue
-
-        goodreads_id = get_goodreads_id(url)
-        if not goodreads_id:
-            rows.append(["", ""])
-            continue
-
-        in_ll, status, pub_date = get_book_status(goodreads_id, book_type, ll_books)
-        if status == "Downloaded":
-            print(f"{book_type.capitalize()} with GoodReads ID {goodreads_id} is Downloaded")
-        elif not in_ll:
-            if add_to_lazylibrarian(goodreads_id, book_type):
-                print(f"Added {book_type} with GoodReads ID {goodreads_id} to LazyLibrarian")
+    rows = [process_book_row(row_data, book_type, ll_books) for row_data in links]
+
+    if rows and google_cfg.write_status:
+        update_sheet_statuses(sheets_service, rows, links, range_name, spreadsheet_id)
+
+
+# One add per title per run: rows repeating a title (or a title in both the movie and TV passes)
+# wait on the first row's add instead of POSTing again. The lock only guards the dict, never the I/O.
+_adds_lock = threading.Lock()
+_adds = {}
+
+
+def _add_once(key, add):
+    """Run add() once per key. Returns (result, first) where first is False for duplicate rows."""
+    with _adds_lock:
+        future = _adds.get(key)
+        first = future is None
+        if first:
+            future = _adds[key] = Future()
+    if first:
+        try:
+            future.set_result(add())
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+    return future.result(), first
+
+
+def process_media_row(row_data, radarr_movies, sonarr_series, url_type=None):
+    """Check/add a single movie or TV row and return its [status, release_date] pair."""
+    url = row_data[0] if row_data else ""
+    current_status = row_data[1] if len(row_data) > 1 else ""
+    current_date = row_data[2] if len(row_data) > 2 else ""
+
+    if not url:
+        return ["", ""]
+
+    if current_status == "Downloaded":
+        return [current_status, current_date]
+
+    kind, tmdb_id = get_tmdb_id(url)
+    if not tmdb_id:
+        return ["", ""]
+
+    if kind == 'movie' and url_type != 'tv':
+        in_radarr, status, release_date = get_radarr_status(tmdb_id, radarr_movies)
+        if not in_radarr:
+            added, first = _add_once(('movie', int(tmdb_id)), functools.partial(add_to_radarr, tmdb_id))
+            if added and first:
+                print(f"Added movie with TMDb ID {tmdb_id} to Radarr")
+                status = "Monitored"
+            elif added:
+                print(f"Movie with TMDb ID {tmdb_id} was already added to Radarr by another row")
                 status = "Monitored"
             else:
-                print(f"Failed to add {book_type} with GoodReads ID {goodreads_id} to LazyLibrarian")
+                print(f"Failed to add movie with TMDb ID {tmdb_id} to Radarr")
                 status = "Failed to Add"
-        elif status == "Skipped":
-            # Book exists but Skipped — resume the author then re-queue and search
-            author_id = ll_books.get(str(goodreads_id), {}).get('AuthorID')
-            if author_id:
-                _ll_api({'cmd': 'resumeAuthor', 'id': author_id})
-            want_and_search_lazylibrarian(goodreads_id, book_type)
-            print(f"Re-queued {book_type} with GoodReads ID {goodreads_id} (was Skipped)")
-            status = "Monitored"
         else:
-            print(f"{book_type.capitalize()} with GoodReads ID {goodreads_id} is in LazyLibrarian ({status})")
-
-        rows.append([status, pub_date])
-
-    if rows and google_cfg.write_status:
-        update_sheet_statuses(sheets_service, rows, range_name, spreadsheet_id)
+            print(f"Movie with TMDb ID {tmdb_id} is already in Radarr ({status})")
+        return [status, release_date]
+    elif kind == 'tv' and url_type != 'movie':
+        in_sonarr, status, release_date, show_data = get_sonarr_status(tmdb_id, sonarr_series)
+        if not in_sonarr:
+            added, first = _add_once(('tv', show_data['tvdbId']), functools.partial(add_to_sonarr, show_data))
+            if added and first:
+                print(f"Added show with TMDb ID {tmdb_id} to Sonarr")
+                status = "Monitored"
+            elif added:
+                print(f"Show with TMDb ID {tmdb_id} was already added to Sonarr by another row")
+                status = "Monitored"
+            else:
+                print(f"Failed to add show with TMDb ID {tmdb_id} to Sonarr")
+                status = "Failed to Add"
+        else:
+            print(f"Show with TMDb ID {tmdb_id} is already in Sonarr ({status})")
+        return [status, release_date]
+    return ["", ""]
 
 
-def process_media_tab(sheets_service, range_name, spreadsheet_id, url_type=None):
+def process_media_tab(sheets_service, range_name, spreadsheet_id, radarr_movies, sonarr_series, url_type=None):
     """Process movie/TV rows. url_type: 'movie', 'tv', or None (both)."""
     links = get_google_sheets_data(sheets_service, range_name, spreadsheet_id)
-    rows = []
-
-    for row_data in links:
-        url = row_data[0] if row_data else ""
-        current_status = row_data[1] if len(row_data) > 1 else ""
-        current_date = row_data[2] if len(row_data) > 2 else ""
-
-        if not url:
-            rows.append(["", ""])
-            continue
-
-        if current_status == "Downloaded":
-            rows.append([current_status, current_date])
-            continue
-
-        tmdb_id = get_tmdb_id(url)
-        if not tmdb_id:
-            rows.append(["", ""])
-            continue
-
-        if 'themoviedb.org/movie/' in url and url_type != 'tv':
-            in_radarr, status, release_date = get_radarr_status(tmdb_id)
-            if not in_radarr:
-                if add_to_radarr(tmdb_id):
-                    print(f"Added movie with TMDb ID {tmdb_id} to Radarr")
-                    status = "Monitored"
-                else:
-                    print(f"Failed to add movie with TMDb ID {tmdb_id} to Radarr")
-                    status = "Failed to Add"
-            else:
-                print(f"Movie with TMDb ID {tmdb_id} is already in Radarr ({status})")
-            rows.append([status, release_date])
-        elif 'themoviedb.org/tv/' in url and url_type != 'movie':
-            in_sonarr, status, release_date = get_sonarr_status(tmdb_id)
-            if not in_sonarr:
-                if add_to_sonarr(tmdb_id):
-                    print(f"Added show with TMDb ID {tmdb_id} to Sonarr")
-                    status = "Monitored"
-                else:
-                    print(f"Failed to add show with TMDb ID {tmdb_id} to Sonarr")
-                    status = "Failed to Add"
-            else:
-                print(f"Show with TMDb ID {tmdb_id} is already in Sonarr ({status})")
-            rows.append([status, release_date])
-        else:
-            rows.append(["", ""])
+
+    # Rows are independent and network-bound, so check them concurrently.
+    # map() yields results in input order, so rows still line up with the sheet.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        process_row = functools.partial(process_media_row, radarr_movies=radarr_movies,
+                                        sonarr_series=sonarr_series, url_type=url_type)
+        rows = list(executor.map(process_row, links))
 
     if rows and google_cfg.write_status:
-        update_sheet_statuses(sheets_service, rows, range_name, spreadsheet_id)
+        update_sheet_statuses(sheets_service, rows, links, range_name, spreadsheet_id)
 
 
 # Main function
-def main():
+def main(config_path=_CONFIG_PATH):
+    # Config is read here rather than at import, so importing the module has no side effects
+    configure(config_path)
     sheets_service = build_sheets_service()
 
-    # Movies and TV shows
+    # Movies and TV shows: pull each library once instead of querying per row
+    radarr_movies = fetch_radarr_movies()
+    sonarr_series = fetch_sonarr_series()
     if radarr_cfg.spreadsheet_id == sonarr_cfg.spreadsheet_id and radarr_cfg.range == sonarr_cfg.range:
         # Same spreadsheet and range: process both URL types in one read/write pass
-        process_media_tab(sheets_service, radarr_cfg.range, radarr_cfg.spreadsheet_id)
+        process_media_tab(sheets_service, radarr_cfg.range, radarr_cfg.spreadsheet_id,
+                          radarr_movies, sonarr_series)
     else:
         # Different spreadsheets or ranges: process each separately
-        process_media_tab(sheets_service, radarr_cfg.range, radarr_cfg.spreadsheet_id, url_type='movie')
-        process_media_tab(sheets_service, sonarr_cfg.range, sonarr_cfg.spreadsheet_id, url_type='tv')
+        process_media_tab(sheets_service, radarr_cfg.range, radarr_cfg.spreadsheet_id,
+                          radarr_movies, sonarr_series, url_type='movie')
+        process_media_tab(sheets_service, sonarr_cfg.range, sonarr_cfg.spreadsheet_id,
+                          radarr_movies, sonarr_series, url_type='tv')
 
     # Ebooks and audiobooks
     if ll_cfg.url and ll_cfg.api_key: